@@ -13,9 +13,7 @@ from utils.data_fetcher import (
 from utils.fundamental_analysis import (
     create_company_overview,
     create_financial_ratios_table,
-    create_income_statement_chart,
-    create_balance_sheet_chart,
-    create_cash_flow_chart
+    create_all_statement_figs
 )
 
 st.set_page_config(
@@ -164,8 +162,11 @@ def main():
             period_options = ["annual", "quarterly"]
             selected_period = st.radio("Select Period", period_options, horizontal=True)
             
+            # Fetch all three statements concurrently and build their charts once for every tab
+            income_figs, balance_figs, cash_flow_figs = create_all_statement_figs(stock_symbol, period=selected_period)
+            
             # Create income statement charts
-            income_chart, income_table = create_income_statement_chart(stock_symbol, period=selected_period)
+            income_chart, income_table = income_figs
             
             # Show income statement chart
             st.plotly_chart(income_chart, use_container_width=True)
@@ -199,7 +200,7 @@ def main():
             st.subheader("Balance Sheet Analysis")
             
             # Create balance sheet charts
-            balance_chart, balance_table = create_balance_sheet_chart(stock_symbol, period=selected_period)
+            balance_chart, balance_table = balance_figs
             
             # Show balance sheet chart
             st.plotly_chart(balance_chart, use_container_width=True)
@@ -233,7 +234,7 @@ def main():
             st.subheader("Cash Flow Analysis")
             
             # Create cash flow charts
-            cash_flow_chart, cash_flow_table = create_cash_flow_chart(stock_symbol, period=selected_period)
+            cash_flow_chart, cash_flow_table = cash_flow_figs
             
             # Show cash flow chart
             st.plotly_chart(cash_flow_chart, use_container_width=True)
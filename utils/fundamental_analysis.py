@@ -1,10 +1,20 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 from utils.data_fetcher import get_financial_ratios, get_income_statement, get_balance_sheet, get_cash_flow
 
+# Serialize figures with orjson; the statement tables are large and the stdlib encoder is slow on them
+pio.json.config.default_engine = 'orjson'
+
+# Financial statement figures are cached per symbol/period for this many seconds
+_STATEMENT_CACHE_SECONDS = 3600
+
 def format_large_number(number, precision=2):
     """
     Format large numbers to more readable format (e.g., 1,000,000 -> 1M)
@@ -29,6 +39,32 @@ def format_large_number(number, precision=2):
         return f"{number:.{precision}f}"
 
 
+_LARGE_NUMBER_SCALES = np.array([1_000_000_000, 1_000_000, 1_000, 1], dtype=np.float64)
+_LARGE_NUMBER_SUFFIXES = np.array(['B', 'M', 'K', ''])
+
+
+def _format_large_number_array(values, precision=2):
+    """
+    Vectorized format_large_number for a whole column of values
+    
+    Parameters:
+        values (np.ndarray): Numbers to format (NaN is rendered as "N/A")
+        precision (int): Decimal precision
+        
+    Returns:
+        np.ndarray: Formatted strings
+    """
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(values)
+    
+    # Bucket index into the scale/suffix tables: 0=B, 1=M, 2=K, 3=none
+    bucket = (magnitude < 1_000_000_000).astype(np.intp) + (magnitude < 1_000_000) + (magnitude < 1_000)
+    scaled = values / _LARGE_NUMBER_SCALES[bucket]
+    
+    formatted = np.char.add(np.char.mod(f"%.{precision}f", scaled), _LARGE_NUMBER_SUFFIXES[bucket])
+    return np.where(np.isnan(values), "N/A", formatted)
+
+
 def format_percentage(number, precision=2):
     """
     Format a decimal as a percentage string
@@ -46,40 +82,100 @@ def format_percentage(number, precision=2):
     return f"{number:.{precision}f}%"
 
 
-def create_company_overview(stock_info):
+# Message-only figures shared by every caller, keyed by message text
+_EMPTY_FIG_CACHE = {}
+
+
+def _empty_figure(text):
     """
-    Create a comprehensive company overview figure
+    Get a blank figure showing a centered message
+    
+    The figure is cached and shared between calls, so callers must not modify it.
     
     Parameters:
-        stock_info (dict): Stock information
+        text (str): Message to display
         
     Returns:
-        plotly.graph_objects.Figure: Company overview figure
+        plotly.graph_objects.Figure: Figure with the message annotation
     """
-    # Create figure
-    fig = go.Figure()
+    fig = _EMPTY_FIG_CACHE.get(text)
+    if fig is None:
+        fig = go.Figure()
+        fig.add_annotation(
+            text=text,
+            align="center",
+            showarrow=False,
+            xref="paper",
+            yref="paper",
+            x=0.5,
+            y=0.5,
+            font=dict(size=14),
+        )
+        _EMPTY_FIG_CACHE[text] = fig
+    return fig
+
+
+class _StatementUnavailable(Exception):
+    """
+    Raised while building statement figures when there is nothing to chart
+    
+    Raising instead of returning message figures keeps empty and failed builds
+    out of the lru_cache, so the next page load retries the fetch.
     
-    # Company name and symbol
-    company_name = stock_info.get('name', 'N/A')
-    symbol = stock_info.get('symbol', 'N/A').replace('.NS', '')
-    
-    # Format market cap
-    market_cap = stock_info.get('market_cap', 0)
-    market_cap_str = format_large_number(market_cap)
-    
-    # Get other key metrics
-    sector = stock_info.get('sector', 'N/A')
-    industry = stock_info.get('industry', 'N/A')
-    current_price = stock_info.get('current_price', 0)
-    pe_ratio = stock_info.get('pe_ratio', 0)
-    eps = stock_info.get('eps', 0)
-    dividend_yield = stock_info.get('dividend_yield', 0)
-    fifty_two_week_high = stock_info.get('52_week_high', 0)
-    fifty_two_week_low = stock_info.get('52_week_low', 0)
-    
-    # Create the overview text
-    overview_text = f"""
-    <span style='font-size: 24px; font-weight: bold;'>{company_name} ({symbol})</span><br>
+    Parameters:
+        chart_msg (str): Message shown in the chart figure
+        table_msg (str): Message shown in the table figure (default: chart_msg)
+    """
+    def __init__(self, chart_msg, table_msg=None):
+        super().__init__(chart_msg)
+        self.chart_msg = chart_msg
+        self.table_msg = table_msg or chart_msg
+
+
+def _safe_two_figs(chart_msg, table_msg=None):
+    """
+    Decorator for builders returning (chart figure, table figure)
+    
+    Any exception raised by the builder is logged and re-raised as
+    _StatementUnavailable carrying the error messages.
+    
+    Parameters:
+        chart_msg (str): Message shown in the chart figure on error
+        table_msg (str): Message shown in the table figure (default: chart_msg)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except _StatementUnavailable:
+                raise
+            except Exception as e:
+                print(f"{chart_msg}: {e}")
+                raise _StatementUnavailable(chart_msg, table_msg) from e
+        return wrapper
+    return decorator
+
+
+def _figs_or_message(build, *args):
+    """
+    Call a statement figure builder, turning _StatementUnavailable into message figures
+    
+    Parameters:
+        build (callable): Builder returning (chart figure, table figure)
+        
+    Returns:
+        tuple: (chart figure, table figure)
+    """
+    try:
+        return build(*args)
+    except _StatementUnavailable as e:
+        return _empty_figure(e.chart_msg), _empty_figure(e.table_msg)
+
+
+# Company overview markup, filled from the stock_info dict via str.format_map
+_OVERVIEW_TEMPLATE = """
+    <span style='font-size: 24px; font-weight: bold;'>{name} ({symbol})</span><br>
     <span style='font-size: 18px;'>{sector} | {industry}</span><br>
     <br>
     <span style='font-size: 20px; font-weight: bold;'>₹{current_price:,.2f}</span><br>
@@ -88,8 +184,45 @@ def create_company_overview(stock_info):
     <span style='font-size: 16px;'><b>P/E Ratio:</b> {pe_ratio:.2f}</span><br>
     <span style='font-size: 16px;'><b>EPS:</b> ₹{eps:.2f}</span><br>
     <span style='font-size: 16px;'><b>Dividend Yield:</b> {dividend_yield:.2f}%</span><br>
-    <span style='font-size: 16px;'><b>52-Week Range:</b> ₹{fifty_two_week_low:,.2f} - ₹{fifty_two_week_high:,.2f}</span><br>
+    <span style='font-size: 16px;'><b>52-Week Range:</b> ₹{52_week_low:,.2f} - ₹{52_week_high:,.2f}</span><br>
+    """
+
+# Numeric overview fields need a number for their format spec when missing
+_OVERVIEW_NUMERIC_DEFAULTS = {
+    'current_price': 0,
+    'pe_ratio': 0,
+    'eps': 0,
+    'dividend_yield': 0,
+    '52_week_high': 0,
+    '52_week_low': 0
+}
+
+
+class _SafeDict(dict):
+    """Dictionary that supplies overview defaults for missing keys"""
+    
+    def __missing__(self, key):
+        return _OVERVIEW_NUMERIC_DEFAULTS.get(key, 'N/A')
+
+
+def create_company_overview(stock_info):
     """
+    Create a comprehensive company overview figure
+    
+    Parameters:
+        stock_info (dict): Stock information
+        
+    Returns:
+        plotly.graph_objects.Figure: Company overview figure
+    """
+    # Create figure
+    fig = go.Figure()
+    
+    # Fill the overview template; missing fields fall back to "N/A" (or 0 for numbers)
+    info = _SafeDict(stock_info)
+    info['symbol'] = info['symbol'].replace('.NS', '')
+    info['market_cap_str'] = format_large_number(info.get('market_cap', 0))
+    overview_text = _OVERVIEW_TEMPLATE.format_map(info)
     
     # Add the overview text to the figure
     fig.add_annotation(
@@ -103,21 +236,58 @@ def create_company_overview(stock_info):
         font=dict(size=14),
     )
     
-    # Update layout
+    # Update layout and hide the axes
     fig.update_layout(
         height=300,
         margin=dict(l=20, r=20, t=20, b=20),
         plot_bgcolor='white',
         paper_bgcolor='white',
+        xaxis=dict(showticklabels=False, showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(showticklabels=False, showgrid=False, zeroline=False, visible=False),
     )
     
-    # Remove axes
-    fig.update_xaxes(showticklabels=False, showgrid=False, zeroline=False)
-    fig.update_yaxes(showticklabels=False, showgrid=False, zeroline=False)
-    
     return fig
 
 
+# Ratio names grouped by the category they are displayed under
+_RATIO_CATEGORIES = {
+    'Valuation Ratios': (
+        'PE Ratio (TTM)',
+        'Forward PE',
+        'PEG Ratio',
+        'Price to Sales (TTM)',
+        'Price to Book',
+        'Enterprise Value/EBITDA',
+        'Enterprise Value/Revenue'
+    ),
+    'Profitability Ratios': (
+        'Profit Margin',
+        'Operating Margin (TTM)',
+        'Return on Assets (TTM)',
+        'Return on Equity (TTM)'
+    ),
+    'Growth Metrics': (
+        'Revenue Growth (YoY)',
+        'Earnings Growth (YoY)'
+    ),
+    'Dividend Metrics': (
+        'Dividend Yield',
+        'Dividend Rate',
+        'Payout Ratio'
+    ),
+    'Risk Metrics': (
+        'Beta (5Y Monthly)',
+        'Debt to Equity',
+        'Current Ratio',
+        'Quick Ratio'
+    )
+}
+
+# Reverse lookup from ratio name to its category, and the order categories are shown in
+_RATIO_TO_CATEGORY = {name: category for category, names in _RATIO_CATEGORIES.items() for name in names}
+_CATEGORY_ORDER = tuple(_RATIO_CATEGORIES)
+
+
 def create_financial_ratios_table(symbol):
     """
     Create a table of financial ratios for a given stock
@@ -133,52 +303,7 @@ def create_financial_ratios_table(symbol):
     
     if not ratios:
         # Return empty figure with message if no data
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No financial ratio data available",
-            align="center",
-            showarrow=False,
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            font=dict(size=14),
-        )
-        return fig
-    
-    # Group ratios by category
-    categories = {
-        'Valuation Ratios': [
-            'PE Ratio (TTM)',
-            'Forward PE',
-            'PEG Ratio',
-            'Price to Sales (TTM)',
-            'Price to Book',
-            'Enterprise Value/EBITDA',
-            'Enterprise Value/Revenue'
-        ],
-        'Profitability Ratios': [
-            'Profit Margin',
-            'Operating Margin (TTM)',
-            'Return on Assets (TTM)',
-            'Return on Equity (TTM)'
-        ],
-        'Growth Metrics': [
-            'Revenue Growth (YoY)',
-            'Earnings Growth (YoY)'
-        ],
-        'Dividend Metrics': [
-            'Dividend Yield',
-            'Dividend Rate',
-            'Payout Ratio'
-        ],
-        'Risk Metrics': [
-            'Beta (5Y Monthly)',
-            'Debt to Equity',
-            'Current Ratio',
-            'Quick Ratio'
-        ]
-    }
+        return _empty_figure("No financial ratio data available")
     
     # Create a single figure with a table that includes all categories
     headers = ['Category', 'Ratio', 'Value']
@@ -186,10 +311,16 @@ def create_financial_ratios_table(symbol):
     ratios_col = []
     values_col = []
     
+    # Bucket the available ratios by category in a single pass
+    buckets = {category: {} for category in _CATEGORY_ORDER}
+    for name, value in ratios.items():
+        category = _RATIO_TO_CATEGORY.get(name)
+        if category is not None and value is not None:
+            buckets[category][name] = value
+    
     # Process data for all categories
-    for category, ratios_list in categories.items():
-        # Filter ratios for this category
-        category_ratios = {key: ratios.get(key) for key in ratios_list if key in ratios and ratios.get(key) is not None}
+    for category in _CATEGORY_ORDER:
+        category_ratios = buckets[category]
         
         if category_ratios:
             # Add category as a header row
@@ -252,170 +383,222 @@ def create_financial_ratios_table(symbol):
     return fig
 
 
-def create_income_statement_chart(symbol, period='annual'):
+def _format_period_columns(columns):
+    """Convert statement period columns (dates) to 'YYYY-MM-DD' strings"""
+    return [col.strftime('%Y-%m-%d') if hasattr(col, 'strftime') else str(col) for col in columns]
+
+
+def _create_statement_table(statement, title, symbol, period):
     """
-    Create income statement visualization
+    Create a detailed table figure for a financial statement
     
     Parameters:
+        statement (pd.DataFrame): Statement with line items as rows and periods as columns
+        title (str): Statement name used in the figure title
         symbol (str): Stock symbol
         period (str): 'annual' or 'quarterly'
         
     Returns:
-        tuple: (chart figure, table figure)
+        plotly.graph_objects.Figure: Table figure
     """
-    # Get income statement data
-    income_stmt = get_income_statement(symbol, period)
-    
-    # Create empty figures for chart and table
-    chart_fig = go.Figure()
-    table_fig = go.Figure()
-    
-    if income_stmt.empty:
-        # Return empty figures with message if no data
-        for fig in [chart_fig, table_fig]:
-            fig.add_annotation(
-                text="No income statement data available",
-                align="center",
-                showarrow=False,
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                font=dict(size=14),
+    # Format numbers for the whole statement at once (non-numeric cells become "N/A")
+    numeric = statement.apply(pd.to_numeric, errors='coerce').to_numpy(np.float64)
+    formatted = _format_large_number_array(numeric)
+    
+    # Hand plotly plain arrays (one per column) rather than pandas objects
+    columns = list(statement.columns)
+    cell_values = [statement.index.to_numpy()] + list(formatted.T)
+    
+    table_fig = go.Figure(
+        data=[
+            go.Table(
+                header=dict(
+                    values=['Metric'] + columns,
+                    font=dict(size=12, color='white'),
+                    fill_color='#1E88E5',
+                    align='left'
+                ),
+                cells=dict(
+                    values=cell_values,
+                    font=dict(size=11),
+                    fill_color='white',
+                    align=['left'] + ['right'] * len(columns)
+                )
             )
-        return chart_fig, table_fig
-    
-    try:
-        # Convert column headers (dates) to strings
-        income_stmt.columns = [col.strftime('%Y-%m-%d') if hasattr(col, 'strftime') else str(col) for col in income_stmt.columns]
-        
-        # Select key metrics
-        key_metrics = [
-            'Total Revenue',
-            'Gross Profit',
-            'Operating Income',
-            'Net Income',
-            'EBITDA'
         ]
-        
-        # Filter for available metrics
-        available_metrics = [metric for metric in key_metrics if metric in income_stmt.index]
-        
-        if not available_metrics:
-            # If none of the key metrics are available, use what we have
-            available_metrics = list(income_stmt.index)[:5]  # First 5 metrics
-        
-        # Create a new DataFrame with only the key metrics
-        chart_data = income_stmt.loc[available_metrics]
-        
-        # Transpose so dates become rows
-        chart_data = chart_data.transpose()
-        chart_data.index = pd.to_datetime(chart_data.index)
-        chart_data = chart_data.sort_index()
-        
-        # Reset index to make Date a column
-        chart_data.reset_index(inplace=True)
-        chart_data.rename(columns={'index': 'Date'}, inplace=True)
+    )
     
-        # Create figure for key metrics over time
-        colors = ['#1E88E5', '#43A047', '#E53935', '#9C27B0', '#FF9800']
-        
-        for i, metric in enumerate(available_metrics):
-            chart_fig.add_trace(
-                go.Bar(
-                    x=chart_data['Date'],
-                    y=chart_data[metric],
-                    name=metric,
-                    marker_color=colors[i % len(colors)]
-                )
-            )
-        
-        # Update layout
-        chart_fig.update_layout(
-            title=f"Income Statement - {symbol.replace('.NS', '')} ({period.capitalize()})",
-            xaxis_title="Date",
-            yaxis_title="Amount (₹)",
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            ),
-            height=500,
-            margin=dict(l=50, r=50, t=80, b=50),
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(
-                family="Roboto, sans-serif",
-                size=12,
-                color="#212121"
-            )
-        )
-        
-        # Create table with full income statement
-        table_data = income_stmt.copy()
-        
-        # Format numbers
-        for col in table_data.columns:
-            table_data[col] = table_data[col].apply(lambda x: format_large_number(x) if pd.notnull(x) else "N/A")
-        
-        table_fig = go.Figure(
-            data=[
-                go.Table(
-                    header=dict(
-                        values=['Metric'] + list(table_data.columns),
-                        font=dict(size=12, color='white'),
-                        fill_color='#1E88E5',
-                        align='left'
-                    ),
-                    cells=dict(
-                        values=[table_data.index] + [table_data[col] for col in table_data.columns],
-                        font=dict(size=11),
-                        fill_color='white',
-                        align=['left'] + ['right'] * len(table_data.columns)
-                    )
-                )
-            ]
+    table_fig.update_layout(
+        title=f"Detailed {title} - {symbol.replace('.NS', '')} ({period.capitalize()})",
+        height=400 + 30 * len(statement.index),  # Adjust height based on number of rows
+        margin=dict(l=20, r=20, t=80, b=20),
+        font=dict(
+            family="Roboto, sans-serif",
+            size=12,
+            color="#212121"
         )
+    )
+    
+    return table_fig
+
+
+def _build_bar_and_table(statement, metric_mapping, colors, title, symbol, period):
+    """
+    Create a bar chart of key metrics over time plus a detailed table for a financial statement
+    
+    Parameters:
+        statement (pd.DataFrame): Statement with line items as rows and periods as columns
+        metric_mapping (dict): Rows to chart, mapped to the names shown in the legend
+        colors (list): Bar colors, cycled across the charted metrics
+        title (str): Statement name used in the figure titles
+        symbol (str): Stock symbol
+        period (str): 'annual' or 'quarterly'
         
-        table_fig.update_layout(
-            title=f"Detailed Income Statement - {symbol.replace('.NS', '')} ({period.capitalize()})",
-            height=400 + 30 * len(table_data.index),  # Adjust height based on number of rows
-            margin=dict(l=20, r=20, t=80, b=20),
-            font=dict(
-                family="Roboto, sans-serif",
-                size=12,
-                color="#212121"
+    Returns:
+        tuple: (chart figure, table figure)
+    """
+    # Create a new DataFrame with only the key metrics
+    chart_data = statement.loc[list(metric_mapping)]
+    
+    # Transpose so dates become rows; the sorted DatetimeIndex is used directly as x
+    chart_data = chart_data.transpose()
+    chart_data.index = pd.to_datetime(chart_data.index)
+    chart_data = chart_data.sort_index()
+    dates = chart_data.index.to_numpy()
+    
+    # Create figure for key metrics over time
+    chart_fig = go.Figure()
+    
+    for i, (metric, name) in enumerate(metric_mapping.items()):
+        chart_fig.add_trace(
+            go.Bar(
+                x=dates,
+                y=chart_data[metric].to_numpy(),
+                name=name,
+                marker_color=colors[i % len(colors)]
             )
         )
-    except Exception as e:
-        print(f"Error creating income statement chart: {e}")
-        chart_fig.add_annotation(
-            text="Error creating income statement chart",
-            align="center",
-            showarrow=False,
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            font=dict(size=14),
-        )
-        
-        table_fig.add_annotation(
-            text="Error creating income statement table",
-            align="center",
-            showarrow=False,
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            font=dict(size=14),
+    
+    # Update layout
+    chart_fig.update_layout(
+        title=f"{title} - {symbol.replace('.NS', '')} ({period.capitalize()})",
+        xaxis_title="Date",
+        yaxis_title="Amount (₹)",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        height=500,
+        margin=dict(l=50, r=50, t=80, b=50),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(
+            family="Roboto, sans-serif",
+            size=12,
+            color="#212121"
         )
+    )
+    
+    table_fig = _create_statement_table(statement, title, symbol, period)
     
     return chart_fig, table_fig
 
 
+def _statement_cache_bucket():
+    """Time bucket used to expire cached financial statement figures"""
+    return int(time.time() // _STATEMENT_CACHE_SECONDS)
+
+
+# Income statement line items charted over time
+_INCOME_KEY_METRICS = (
+    'Total Revenue',
+    'Gross Profit',
+    'Operating Income',
+    'Net Income',
+    'EBITDA'
+)
+
+_INCOME_COLORS = ('#1E88E5', '#43A047', '#E53935', '#9C27B0', '#FF9800')
+
+
+def create_income_statement_chart(symbol, period='annual'):
+    """
+    Create income statement visualization
+    
+    Parameters:
+        symbol (str): Stock symbol
+        period (str): 'annual' or 'quarterly'
+        
+    Returns:
+        tuple: (chart figure, table figure)
+    """
+    return _figs_or_message(_income_statement_figs, symbol, period, _statement_cache_bucket())
+
+
+@lru_cache(maxsize=128)
+def _income_statement_figs(symbol, period, cache_bucket):
+    """Fetch and build the income statement figures (memoized per symbol, period and cache bucket)"""
+    return _build_income_figs_from_df(get_income_statement(symbol, period), symbol, period)
+
+
+@_safe_two_figs("Error creating income statement chart", "Error creating income statement table")
+def _build_income_figs_from_df(income_stmt, symbol, period):
+    """Build the income statement (chart, table) figures from an already fetched statement"""
+    if income_stmt.empty:
+        # Nothing to chart; raised so the empty result is not cached
+        raise _StatementUnavailable("No income statement data available")
+    
+    # Convert column headers (dates) to strings
+    income_stmt.columns = _format_period_columns(income_stmt.columns)
+    
+    # Filter for available metrics
+    available_metrics = [metric for metric in _INCOME_KEY_METRICS if metric in income_stmt.index]
+    
+    if not available_metrics:
+        # If none of the key metrics are available, use what we have
+        available_metrics = list(income_stmt.index)[:5]  # First 5 metrics
+    
+    return _build_bar_and_table(
+        income_stmt,
+        {metric: metric for metric in available_metrics},
+        _INCOME_COLORS,
+        "Income Statement",
+        symbol,
+        period
+    )
+
+
+# Asset and liability/equity line items used for the balance sheet overview
+_BALANCE_ASSET_ITEMS = (
+    'Total Assets',
+    'Total Current Assets',
+    'Cash And Cash Equivalents',
+    'Inventory',
+    'Net Receivables',
+    'Other Current Assets',
+    'Property Plant Equipment',
+    'Long Term Investments',
+    'Goodwill',
+    'Intangible Assets'
+)
+
+_BALANCE_LIABILITY_ITEMS = (
+    'Total Liabilities',
+    'Total Current Liabilities',
+    'Accounts Payable',
+    'Short Term Debt',
+    'Other Current Liabilities',
+    'Long Term Debt',
+    'Other Liabilities',
+    'Total Stockholder Equity',
+    'Common Stock',
+    'Retained Earnings'
+)
+
+
 def create_balance_sheet_chart(symbol, period='annual'):
     """
     Create balance sheet visualization
@@ -427,177 +610,120 @@ def create_balance_sheet_chart(symbol, period='annual'):
     Returns:
         tuple: (chart figure, table figure)
     """
-    # Get balance sheet data
-    balance_sheet = get_balance_sheet(symbol, period)
+    return _figs_or_message(_balance_sheet_figs, symbol, period, _statement_cache_bucket())
+
+
+@lru_cache(maxsize=128)
+def _balance_sheet_figs(symbol, period, cache_bucket):
+    """Fetch and build the balance sheet figures (memoized per symbol, period and cache bucket)"""
+    return _build_balance_figs_from_df(get_balance_sheet(symbol, period), symbol, period)
+
+
+@_safe_two_figs("Error creating balance sheet visualization")
+def _build_balance_figs_from_df(balance_sheet, symbol, period):
+    """Build the balance sheet (chart, table) figures from an already fetched statement"""
+    if balance_sheet.empty:
+        # Nothing to chart; raised so the empty result is not cached
+        raise _StatementUnavailable("No balance sheet data available")
     
-    # Create empty figures for chart and table
+    # Convert column headers (dates) to strings
+    balance_sheet.columns = _format_period_columns(balance_sheet.columns)
+    
+    # Filter for available items
+    available_assets = [item for item in _BALANCE_ASSET_ITEMS if item in balance_sheet.index]
+    available_liabilities = [item for item in _BALANCE_LIABILITY_ITEMS if item in balance_sheet.index]
+    
+    if not available_assets or not available_liabilities:
+        # If key metrics are not available, raise an exception to be caught by _safe_two_figs
+        raise ValueError("Required balance sheet metrics not available")
+    
+    # Get the most recent date
+    latest_date = balance_sheet.columns[0]
+    
+    # Create data for stacked bar chart
     chart_fig = go.Figure()
-    table_fig = go.Figure()
     
-    if balance_sheet.empty:
-        # Return empty figures with message if no data
-        for fig in [chart_fig, table_fig]:
-            fig.add_annotation(
-                text="No balance sheet data available",
-                align="center",
-                showarrow=False,
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                font=dict(size=14),
-            )
-        return chart_fig, table_fig
+    # Only the largest item of each group is charted, so take the max rather than sorting
+    assets_series = balance_sheet.loc[available_assets, latest_date].dropna()
+    liabilities_equity_series = balance_sheet.loc[available_liabilities, latest_date].dropna()
     
-    try:
-        # Convert column headers (dates) to strings
-        balance_sheet.columns = [col.strftime('%Y-%m-%d') if hasattr(col, 'strftime') else str(col) for col in balance_sheet.columns]
-        
-        # Create asset and liability groups
-        asset_items = [
-            'Total Assets',
-            'Total Current Assets',
-            'Cash And Cash Equivalents',
-            'Inventory',
-            'Net Receivables',
-            'Other Current Assets',
-            'Property Plant Equipment',
-            'Long Term Investments',
-            'Goodwill',
-            'Intangible Assets'
-        ]
-        
-        liability_equity_items = [
-            'Total Liabilities',
-            'Total Current Liabilities',
-            'Accounts Payable',
-            'Short Term Debt',
-            'Other Current Liabilities',
-            'Long Term Debt',
-            'Other Liabilities',
-            'Total Stockholder Equity',
-            'Common Stock',
-            'Retained Earnings'
-        ]
-        
-        # Filter for available items
-        available_assets = [item for item in asset_items if item in balance_sheet.index]
-        available_liabilities = [item for item in liability_equity_items if item in balance_sheet.index]
-        
-        if not available_assets or not available_liabilities:
-            # If key metrics are not available, raise an exception to be caught by the outer try/except
-            raise ValueError("Required balance sheet metrics not available")
-        
-        # Get the most recent date
-        latest_date = balance_sheet.columns[0]
-        
-        # Create data for stacked bar chart
-        assets_data = balance_sheet.loc[available_assets, latest_date].sort_values(ascending=False)
-        liabilities_equity_data = balance_sheet.loc[available_liabilities, latest_date].sort_values(ascending=False)
-        
-        # Assets
-        chart_fig.add_trace(
-            go.Bar(
-                x=['Assets'],
-                y=[assets_data[0]],  # Total assets
-                name='Total Assets',
-                marker_color='#1E88E5'
-            )
+    total_assets = assets_series.max()
+    total_liabilities = liabilities_equity_series.max() if len(liabilities_equity_series) > 0 else 0
+    
+    # Assets
+    chart_fig.add_trace(
+        go.Bar(
+            x=['Assets'],
+            y=[total_assets],
+            name='Total Assets',
+            marker_color='#1E88E5'
         )
-        
-        # Liabilities
+    )
+    
+    # Liabilities
+    chart_fig.add_trace(
+        go.Bar(
+            x=['Liabilities & Equity'],
+            y=[total_liabilities],
+            name='Total Liabilities',
+            marker_color='#E53935'
+        )
+    )
+    
+    # Equity (if available)
+    equity_item = 'Total Stockholder Equity'
+    if equity_item in balance_sheet.index:
+        equity_value = balance_sheet.loc[equity_item, latest_date]
         chart_fig.add_trace(
             go.Bar(
                 x=['Liabilities & Equity'],
-                y=[liabilities_equity_data[0] if len(liabilities_equity_data) > 0 else 0],  # Total liabilities
-                name='Total Liabilities',
-                marker_color='#E53935'
-            )
-        )
-        
-        # Equity (if available)
-        equity_item = 'Total Stockholder Equity'
-        if equity_item in balance_sheet.index:
-            equity_value = balance_sheet.loc[equity_item, latest_date]
-            chart_fig.add_trace(
-                go.Bar(
-                    x=['Liabilities & Equity'],
-                    y=[equity_value],
-                    name='Stockholder Equity',
-                    marker_color='#43A047'
-                )
-            )
-        
-        # Update layout
-        chart_fig.update_layout(
-            title=f"Balance Sheet Overview - {symbol.replace('.NS', '')} ({latest_date})",
-            yaxis_title="Amount (₹)",
-            barmode='stack',
-            height=500,
-            margin=dict(l=50, r=50, t=80, b=50),
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(
-                family="Roboto, sans-serif",
-                size=12,
-                color="#212121"
+                y=[equity_value],
+                name='Stockholder Equity',
+                marker_color='#43A047'
             )
         )
-        
-        # Create detailed breakdown figures
-        # Create table with full balance sheet
-        table_data = balance_sheet.copy()
-        
-        # Format numbers
-        for col in table_data.columns:
-            table_data[col] = table_data[col].apply(lambda x: format_large_number(x) if pd.notnull(x) else "N/A")
-        
-        table_fig = go.Figure(
-            data=[
-                go.Table(
-                    header=dict(
-                        values=['Metric'] + list(table_data.columns),
-                        font=dict(size=12, color='white'),
-                        fill_color='#1E88E5',
-                        align='left'
-                    ),
-                    cells=dict(
-                        values=[table_data.index] + [table_data[col] for col in table_data.columns],
-                        font=dict(size=11),
-                        fill_color='white',
-                        align=['left'] + ['right'] * len(table_data.columns)
-                    )
-                )
-            ]
-        )
-        
-        table_fig.update_layout(
-            title=f"Detailed Balance Sheet - {symbol.replace('.NS', '')} ({period.capitalize()})",
-            height=400 + 30 * len(table_data.index),  # Adjust height based on number of rows
-            margin=dict(l=20, r=20, t=80, b=20),
-            font=dict(
-                family="Roboto, sans-serif",
-                size=12,
-                color="#212121"
-            )
+    
+    # Update layout
+    chart_fig.update_layout(
+        title=f"Balance Sheet Overview - {symbol.replace('.NS', '')} ({latest_date})",
+        yaxis_title="Amount (₹)",
+        barmode='stack',
+        height=500,
+        margin=dict(l=50, r=50, t=80, b=50),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(
+            family="Roboto, sans-serif",
+            size=12,
+            color="#212121"
         )
-    except Exception as e:
-        print(f"Error creating balance sheet chart: {e}")
-        for fig in [chart_fig, table_fig]:
-            fig.add_annotation(
-                text="Error creating balance sheet visualization",
-                align="center",
-                showarrow=False,
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                font=dict(size=14),
-            )
+    )
+    
+    # Create table with full balance sheet
+    table_fig = _create_statement_table(balance_sheet, "Balance Sheet", symbol, period)
     
     return chart_fig, table_fig
 
 
+# Map standard cash flow metric names to possible variations in yfinance data
+_CASHFLOW_METRIC_VARIATIONS = {
+    'Operating Cash Flow': ('Operating Cash Flow', 'Total Cash From Operating Activities'),
+    'Cash Flow From Investment': ('Cash Flow From Investment', 'Total Cash From Investing Activities', 'Total Cashflows From Investing Activities'),
+    'Cash Flow From Financing': ('Cash Flow From Financing', 'Total Cash From Financing Activities'),
+    'Free Cash Flow': ('Free Cash Flow',),
+    'Change In Cash': ('Change In Cash', 'Change In Cash And Cash Equivalents')
+}
+
+_CASHFLOW_COLORS = ('#1E88E5', '#E53935', '#43A047', '#9C27B0', '#FF9800')
+
+# Reverse lookup from any yfinance variation to (standard name, priority rank; lower is preferred)
+_CASHFLOW_VARIATION_TO_STANDARD = {
+    variation: (standard_name, rank)
+    for standard_name, variations in _CASHFLOW_METRIC_VARIATIONS.items()
+    for rank, variation in enumerate(variations)
+}
+
+
 def create_cash_flow_chart(symbol, period='annual'):
     """
     Create cash flow visualization
@@ -609,169 +735,75 @@ def create_cash_flow_chart(symbol, period='annual'):
     Returns:
         tuple: (chart figure, table figure)
     """
-    # Get cash flow data
-    cash_flow = get_cash_flow(symbol, period)
-    
-    # Create empty figures for chart and table
-    chart_fig = go.Figure()
-    table_fig = go.Figure()
-    
+    return _figs_or_message(_cash_flow_figs, symbol, period, _statement_cache_bucket())
+
+
+@lru_cache(maxsize=128)
+def _cash_flow_figs(symbol, period, cache_bucket):
+    """Fetch and build the cash flow figures (memoized per symbol, period and cache bucket)"""
+    return _build_cashflow_figs_from_df(get_cash_flow(symbol, period), symbol, period)
+
+
+@_safe_two_figs("Error creating cash flow visualization")
+def _build_cashflow_figs_from_df(cash_flow, symbol, period):
+    """Build the cash flow (chart, table) figures from an already fetched statement"""
     if cash_flow.empty:
-        # Return empty figures with message if no data
-        for fig in [chart_fig, table_fig]:
-            fig.add_annotation(
-                text="No cash flow data available",
-                align="center",
-                showarrow=False,
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                font=dict(size=14),
-            )
-        return chart_fig, table_fig
+        # Nothing to chart; raised so the empty result is not cached
+        raise _StatementUnavailable("No cash flow data available")
+    
+    # Convert column headers (dates) to strings
+    cash_flow.columns = _format_period_columns(cash_flow.columns)
+    
+    # Find available metrics in a single pass over the statement rows,
+    # keeping the highest priority variation found for each standard name
+    best = {}
+    
+    for var in cash_flow.index:
+        match = _CASHFLOW_VARIATION_TO_STANDARD.get(var)
+        if match is not None:
+            standard_name, rank = match
+            if standard_name not in best or rank < best[standard_name][1]:
+                best[standard_name] = (var, rank)
+    
+    # Chart in standard metric order so legend order and colors stay stable
+    metric_mapping = {
+        best[standard_name][0]: standard_name
+        for standard_name in _CASHFLOW_METRIC_VARIATIONS
+        if standard_name in best
+    }
     
-    try:
-        # Convert column headers (dates) to strings
-        cash_flow.columns = [col.strftime('%Y-%m-%d') if hasattr(col, 'strftime') else str(col) for col in cash_flow.columns]
+    if not metric_mapping:
+        # If none of the key metrics are available, use what we have
+        metric_mapping = {metric: metric for metric in list(cash_flow.index)[:5]}  # First 5 metrics
+    
+    return _build_bar_and_table(
+        cash_flow,
+        metric_mapping,
+        _CASHFLOW_COLORS,
+        "Cash Flow",
+        symbol,
+        period
+    )
+
+
+def create_all_statement_figs(symbol, period='annual'):
+    """
+    Create income statement, balance sheet and cash flow visualizations together
+    
+    Parameters:
+        symbol (str): Stock symbol
+        period (str): 'annual' or 'quarterly'
         
-        # Select key metrics
-        key_metrics = [
-            'Operating Cash Flow',
-            'Cash Flow From Investment',
-            'Cash Flow From Financing',
-            'Free Cash Flow',
-            'Change In Cash'
+    Returns:
+        tuple: ((income chart, income table), (balance chart, balance table), (cash flow chart, cash flow table))
+    """
+    cache_bucket = _statement_cache_bucket()
+    
+    # The yfinance requests are I/O bound, so build the three statements on
+    # separate threads; each goes through its own per-statement cache
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(_figs_or_message, statement_figs, symbol, period, cache_bucket)
+            for statement_figs in (_income_statement_figs, _balance_sheet_figs, _cash_flow_figs)
         ]
-        
-        # Map standard names to possible variations in yfinance data
-        metric_variations = {
-            'Operating Cash Flow': ['Operating Cash Flow', 'Total Cash From Operating Activities'],
-            'Cash Flow From Investment': ['Cash Flow From Investment', 'Total Cash From Investing Activities', 'Total Cashflows From Investing Activities'],
-            'Cash Flow From Financing': ['Cash Flow From Financing', 'Total Cash From Financing Activities', 'Total Cash From Financing Activities'],
-            'Free Cash Flow': ['Free Cash Flow'],
-            'Change In Cash': ['Change In Cash', 'Change In Cash And Cash Equivalents']
-        }
-        
-        # Find available metrics
-        available_metrics = []
-        metric_mapping = {}
-        
-        for standard_name, variations in metric_variations.items():
-            for var in variations:
-                if var in cash_flow.index:
-                    available_metrics.append(var)
-                    metric_mapping[var] = standard_name
-                    break
-        
-        if not available_metrics:
-            # If none of the key metrics are available, use what we have
-            available_metrics = list(cash_flow.index)[:5]  # First 5 metrics
-            for metric in available_metrics:
-                metric_mapping[metric] = metric
-        
-        # Create a new DataFrame with only the key metrics
-        chart_data = cash_flow.loc[available_metrics]
-        
-        # Transpose so dates become rows
-        chart_data = chart_data.transpose()
-        chart_data.index = pd.to_datetime(chart_data.index)
-        chart_data = chart_data.sort_index()
-        
-        # Reset index to make Date a column
-        chart_data.reset_index(inplace=True)
-        chart_data.rename(columns={'index': 'Date'}, inplace=True)
-        
-        # Rename columns to standard names
-        chart_data.rename(columns=metric_mapping, inplace=True)
-        
-        # Use standard names in the chart
-        standard_names = list(set(metric_mapping.values()))
-        
-        colors = ['#1E88E5', '#E53935', '#43A047', '#9C27B0', '#FF9800']
-        
-        for i, metric in enumerate(standard_names):
-            if metric in chart_data.columns:
-                chart_fig.add_trace(
-                    go.Bar(
-                        x=chart_data['Date'],
-                        y=chart_data[metric],
-                        name=metric,
-                        marker_color=colors[i % len(colors)]
-                    )
-                )
-        
-        # Update layout
-        chart_fig.update_layout(
-            title=f"Cash Flow - {symbol.replace('.NS', '')} ({period.capitalize()})",
-            xaxis_title="Date",
-            yaxis_title="Amount (₹)",
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            ),
-            height=500,
-            margin=dict(l=50, r=50, t=80, b=50),
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(
-                family="Roboto, sans-serif",
-                size=12,
-                color="#212121"
-            )
-        )
-        
-        # Create table with full cash flow
-        table_data = cash_flow.copy()
-        
-        # Format numbers
-        for col in table_data.columns:
-            table_data[col] = table_data[col].apply(lambda x: format_large_number(x) if pd.notnull(x) else "N/A")
-        
-        table_fig = go.Figure(
-            data=[
-                go.Table(
-                    header=dict(
-                        values=['Metric'] + list(table_data.columns),
-                        font=dict(size=12, color='white'),
-                        fill_color='#1E88E5',
-                        align='left'
-                    ),
-                    cells=dict(
-                        values=[table_data.index] + [table_data[col] for col in table_data.columns],
-                        font=dict(size=11),
-                        fill_color='white',
-                        align=['left'] + ['right'] * len(table_data.columns)
-                    )
-                )
-            ]
-        )
-        
-        table_fig.update_layout(
-            title=f"Detailed Cash Flow - {symbol.replace('.NS', '')} ({period.capitalize()})",
-            height=400 + 30 * len(table_data.index),  # Adjust height based on number of rows
-            margin=dict(l=20, r=20, t=80, b=20),
-            font=dict(
-                family="Roboto, sans-serif",
-                size=12,
-                color="#212121"
-            )
-        )
-    except Exception as e:
-        print(f"Error creating cash flow chart: {e}")
-        for fig in [chart_fig, table_fig]:
-            fig.add_annotation(
-                text="Error creating cash flow visualization",
-                align="center",
-                showarrow=False,
-                xref="paper",
-                yref="paper",
-                x=0.5,
-                y=0.5,
-                font=dict(size=14),
-            )
-    
-    return chart_fig, table_fig
+        return tuple(future.result() for future in futures)
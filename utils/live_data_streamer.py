@@ -1,11 +1,31 @@
 import asyncio
 import websockets
 import json
+import orjson
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import time
 
+# uvloop is optional; fall back to the default asyncio loop without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Number of candles kept in the live chart
+_MAX_CANDLES = 100
+
+# Candle length in seconds for each supported timeframe
+_TIMEFRAME_SECONDS = {"1m": 60, "5m": 300, "15m": 900, "30m": 1800, "60m": 3600, "1d": 86400}
+
+# Simulated ticks generated together, and the time each batch covers
+_TICKS_PER_BATCH = 5
+_TICK_BATCH_INTERVAL = 0.5
+
+# Spacing between the ticks of one batch, in nanoseconds
+_TICK_SPACING_NS = int(_TICK_BATCH_INTERVAL * 1e9) // _TICKS_PER_BATCH
+
 class LiveDataStreamer:
     """
     A class to manage live data streaming for stock prices.
@@ -17,15 +37,25 @@ class LiveDataStreamer:
         self.is_running = False
         self.current_symbol = None
         self.current_price = 0
-        self.price_history = []
         self.subscribers = set()
-        self.candlestick_data = pd.DataFrame()
+        self._tick = {'symbol': None, 'price': 0.0, 'timestamp': 0, 'volume': 0}
+        self._allocate_candle_buffers()
         self.last_update = datetime.now()
         self.timeframe = "1m"
+        self._rng = np.random.default_rng()
+        self._bucket_seconds = _TIMEFRAME_SECONDS[self.timeframe]
+        self._utc_offset = time.localtime().tm_gmtoff
         
     async def start_streaming(self, symbol, initial_price=None):
         """Start streaming data for a symbol"""
         self.is_running = True
+        self._setup_initial_state(symbol, initial_price)
+        
+        # Start the streaming loop
+        asyncio.create_task(self._stream_data())
+    
+    def _setup_initial_state(self, symbol, initial_price=None):
+        """Set the symbol, starting price and initial candles without an event loop"""
         self.current_symbol = symbol
         
         # Set initial price
@@ -33,16 +63,10 @@ class LiveDataStreamer:
             self.current_price = initial_price
         else:
             # Random initial price between 100 and 5000
-            self.current_price = np.random.uniform(100, 5000)
-        
-        # Initialize price history
-        self.price_history = []
+            self.current_price = self._rng.uniform(100, 5000)
         
         # Initialize candlestick data
-        self.candlestick_data = self._initialize_candlestick_data()
-        
-        # Start the streaming loop
-        asyncio.create_task(self._stream_data())
+        self._initialize_candlestick_data()
         
     def stop_streaming(self):
         """Stop streaming data"""
@@ -51,178 +75,162 @@ class LiveDataStreamer:
     async def _stream_data(self):
         """Generate and stream simulated tick data"""
         while self.is_running:
-            # Calculate price movement (simulated)
+            # Calculate price movement (simulated) for a whole batch of ticks
             # More volatility for a more dramatic live appearance like Olymp Trade
-            price_volatility = self.current_price * 0.001  # 0.1% volatility per tick
-            price_change = np.random.normal(0, price_volatility)
-            
-            # Update price
-            self.current_price += price_change
+            returns = self._rng.normal(0, 0.001, _TICKS_PER_BATCH)  # 0.1% volatility per tick
+            prices = self.current_price * np.cumprod(1 + returns)
             
             # Ensure price doesn't go below a minimum
-            self.current_price = max(self.current_price, 1.0)
-            
-            # Create tick data
-            tick_data = {
-                'symbol': self.current_symbol,
-                'price': self.current_price,
-                'timestamp': datetime.now().isoformat(),
-                'volume': np.random.randint(10, 1000)
-            }
+            prices = np.maximum(prices, 1.0)
+            volumes = self._rng.integers(10, 1000, size=_TICKS_PER_BATCH)
             
-            # Add to price history (keep last 1000 ticks)
-            self.price_history.append(tick_data)
-            if len(self.price_history) > 1000:
-                self.price_history = self.price_history[-1000:]
+            # Reuse one tick dict; it is serialized before the next tick overwrites it
+            tick_data = self._tick
+            symbol = self.current_symbol
+            tick_data['symbol'] = symbol
             
-            # Update candlestick data
-            self._update_candlestick_data(tick_data)
+            batch_start_ns = time.time_ns()
             
-            # Notify subscribers
-            await self._notify_subscribers(tick_data)
+            for i, (price, volume) in enumerate(zip(prices.tolist(), volumes.tolist())):
+                if i and self.subscribers:
+                    # Send ticks one at a time while clients are watching, not in a burst
+                    await asyncio.sleep(_TICK_SPACING_NS / 1e9)
+                    
+                    # Drop the rest of the batch if streaming stopped or the symbol changed meanwhile
+                    if not self.is_running or self.current_symbol != symbol:
+                        break
+                
+                # Update price
+                self.current_price = price
+                
+                # Stamp the ticks evenly across the batch interval
+                now_ns = batch_start_ns + i * _TICK_SPACING_NS
+                
+                # Fill in tick data
+                tick_data['price'] = price
+                tick_data['timestamp'] = now_ns  # Epoch nanoseconds; clients format for display
+                tick_data['volume'] = volume
+                
+                # Update candlestick data
+                self._update_candlestick_data(tick_data, now_ns / 1e9)
+                
+                # Notify subscribers
+                self._notify_subscribers(tick_data)
             
-            # Pause very briefly to get multiple ticks per second for smoother real-time visuals
-            await asyncio.sleep(0.1)  # 10 ticks per second for more fluid updates
+            # Wait out the rest of the batch interval, keeping the rate at 10 ticks per second
+            batch_end_ns = batch_start_ns + _TICKS_PER_BATCH * _TICK_SPACING_NS
+            await asyncio.sleep(max(batch_end_ns - time.time_ns(), 0) / 1e9)
+    
+    def _allocate_candle_buffers(self):
+        """Allocate empty ring buffers for the last _MAX_CANDLES candles"""
+        self._times = np.zeros(_MAX_CANDLES, dtype=np.int64)  # Local wall-clock epoch seconds
+        self._open = np.zeros(_MAX_CANDLES, dtype=np.float64)
+        self._high = np.zeros(_MAX_CANDLES, dtype=np.float64)
+        self._low = np.zeros(_MAX_CANDLES, dtype=np.float64)
+        self._close = np.zeros(_MAX_CANDLES, dtype=np.float64)
+        self._volume = np.zeros(_MAX_CANDLES, dtype=np.int64)
+        self._head = 0  # Next slot to write
+        self._count = 0
+        self._last_bucket = None
+        self._current_candle_idx = None  # Slot of the in-progress candle
     
     def _initialize_candlestick_data(self):
         """Initialize candlestick data for different timeframes"""
-        now = datetime.now()
-        
-        # Create times for the past 100 candles based on timeframe
-        times = []
-        if self.timeframe == "1m":
-            times = [now - timedelta(minutes=i) for i in range(100, 0, -1)]
-        elif self.timeframe == "5m":
-            times = [now - timedelta(minutes=5*i) for i in range(100, 0, -1)]
-        elif self.timeframe == "15m":
-            times = [now - timedelta(minutes=15*i) for i in range(100, 0, -1)]
-        elif self.timeframe == "30m":
-            times = [now - timedelta(minutes=30*i) for i in range(100, 0, -1)]
-        elif self.timeframe == "60m":
-            times = [now - timedelta(hours=i) for i in range(100, 0, -1)]
-        elif self.timeframe == "1d":
-            times = [now - timedelta(days=i) for i in range(100, 0, -1)]
-        else:
-            # Default to 1-minute candles
-            times = [now - timedelta(minutes=i) for i in range(100, 0, -1)]
+        # Create times for the past _MAX_CANDLES candles based on timeframe
+        now = int(time.time() + self._utc_offset)
+        times = now - np.arange(_MAX_CANDLES, 0, -1, dtype=np.int64) * self._bucket_seconds
         
         # Generate a price series with random walk
-        prices = []
-        price = self.current_price
-        for i in range(100):
-            # Increased volatility for more dramatic price changes (like Olymp Trade style)
-            price_volatility = price * 0.005  # 0.5% volatility between candles
-            price_change = np.random.normal(0, price_volatility)
-            price += price_change
-            prices.append(price)
+        # Increased volatility for more dramatic price changes (like Olymp Trade style)
+        returns = self._rng.normal(0, 0.005, _MAX_CANDLES)  # 0.5% volatility between candles
+        prices = self.current_price * np.cumprod(1 + returns)
         
-        # Create candlestick data
-        candles = []
-        for i in range(100):
-            open_price = prices[i]
-            
-            # Randomize high, low, and close prices around the open
-            price_volatility = open_price * 0.003  # 0.3% volatility within candle
-            high_price = open_price + abs(np.random.normal(0, price_volatility))
-            low_price = open_price - abs(np.random.normal(0, price_volatility))
-            close_price = np.random.uniform(low_price, high_price)
-            
-            volume = np.random.randint(1000, 100000)
-            
-            candles.append({
-                'Time': times[i],
-                'Open': open_price,
-                'High': high_price,
-                'Low': low_price,
-                'Close': close_price,
-                'Volume': volume
-            })
+        # Randomize high, low, and close prices around the open
+        price_volatility = prices * 0.003  # 0.3% volatility within candle
+        highs = prices + np.abs(self._rng.normal(0, price_volatility))
+        lows = prices - np.abs(self._rng.normal(0, price_volatility))
+        closes = self._rng.uniform(lows, highs)
+        volumes = self._rng.integers(1000, 100000, size=_MAX_CANDLES)
         
-        # Create DataFrame
-        df = pd.DataFrame(candles)
-        df = df.sort_values('Time')
-        
-        return df
+        # Create candlestick data
+        self._allocate_candle_buffers()
+        self._open[:] = prices
+        self._high[:] = highs
+        self._low[:] = lows
+        self._close[:] = closes
+        self._volume[:] = volumes
+        self._times[:] = times
+        # The buffer is full, so the next candle overwrites the oldest at index 0
+        self._head = 0
+        self._count = _MAX_CANDLES
     
-    def _update_candlestick_data(self, tick_data):
-        """Update candlestick data with new tick"""
-        now = datetime.now()
+    def _update_candlestick_data(self, tick_data, now_ts=None):
+        """Update candlestick data with new tick, timestamped now_ts (epoch seconds)"""
         price = tick_data['price']
+        if now_ts is None:
+            now_ts = time.time()
         
-        # Determine the current candle's time
-        current_candle_time = None
-        if self.timeframe == "1m":
-            current_candle_time = datetime(now.year, now.month, now.day, now.hour, now.minute)
-        elif self.timeframe == "5m":
-            minute = (now.minute // 5) * 5
-            current_candle_time = datetime(now.year, now.month, now.day, now.hour, minute)
-        elif self.timeframe == "15m":
-            minute = (now.minute // 15) * 15
-            current_candle_time = datetime(now.year, now.month, now.day, now.hour, minute)
-        elif self.timeframe == "30m":
-            minute = (now.minute // 30) * 30
-            current_candle_time = datetime(now.year, now.month, now.day, now.hour, minute)
-        elif self.timeframe == "60m":
-            current_candle_time = datetime(now.year, now.month, now.day, now.hour)
-        elif self.timeframe == "1d":
-            current_candle_time = datetime(now.year, now.month, now.day)
-        else:
-            # Default to 1-minute candles
-            current_candle_time = datetime(now.year, now.month, now.day, now.hour, now.minute)
+        # Bucket the tick by local wall-clock time, like the candle labels
+        bucket = int(now_ts + self._utc_offset) // self._bucket_seconds
         
-        # Check if the current candle exists in the data
-        if current_candle_time in self.candlestick_data['Time'].values:
-            # Update existing candle
-            candle_idx = self.candlestick_data[self.candlestick_data['Time'] == current_candle_time].index[0]
-            
-            # Update high and low
-            if price > self.candlestick_data.loc[candle_idx, 'High']:
-                self.candlestick_data.loc[candle_idx, 'High'] = price
+        # Ticks almost always land in the newest candle
+        if bucket == self._last_bucket:
+            # Update existing candle using plain Python scalars
+            if price > self._live_high:
+                self._live_high = price
             
-            if price < self.candlestick_data.loc[candle_idx, 'Low']:
-                self.candlestick_data.loc[candle_idx, 'Low'] = price
+            if price < self._live_low:
+                self._live_low = price
             
             # Update close price
-            self.candlestick_data.loc[candle_idx, 'Close'] = price
+            self._live_close = price
             
             # Update volume
-            self.candlestick_data.loc[candle_idx, 'Volume'] += tick_data['volume']
+            self._live_volume += tick_data['volume']
         else:
-            # Create a new candle
-            new_candle = pd.DataFrame({
-                'Time': [current_candle_time],
-                'Open': [price],
-                'High': [price],
-                'Low': [price],
-                'Close': [price],
-                'Volume': [tick_data['volume']]
-            })
+            # Write the finished candle back before starting the next one
+            self._flush_live_candle()
             
-            # Append the new candle
-            self.candlestick_data = pd.concat([self.candlestick_data, new_candle], ignore_index=True)
+            # Create a new candle, overwriting the oldest once the buffer is full
+            i = self._head
+            self._times[i] = bucket * self._bucket_seconds
+            self._open[i] = price
+            self._high[i] = price
+            self._low[i] = price
+            self._close[i] = price
+            self._volume[i] = tick_data['volume']
+            self._live_high = self._live_low = self._live_close = price
+            self._live_volume = tick_data['volume']
+            self._head = (i + 1) % _MAX_CANDLES
+            self._count = min(self._count + 1, _MAX_CANDLES)
+            self._last_bucket = bucket
+            self._current_candle_idx = i
             
-            # Keep only the last 100 candles
-            if len(self.candlestick_data) > 100:
-                self.candlestick_data = self.candlestick_data.tail(100)
+            # Pick up daylight saving changes for the next bucket
+            self._utc_offset = time.localtime().tm_gmtoff
     
-    async def _notify_subscribers(self, data):
+    def _flush_live_candle(self):
+        """Copy the in-progress candle's scalars into the ring buffers"""
+        i = self._current_candle_idx
+        if i is None:
+            return
+        
+        self._high[i] = self._live_high
+        self._low[i] = self._live_low
+        self._close[i] = self._live_close
+        self._volume[i] = self._live_volume
+    
+    def _notify_subscribers(self, data):
         """Send data to all subscribers"""
         if not self.subscribers:
             return
             
-        message = json.dumps(data)
-        
-        # List to track disconnected subscribers
-        disconnected = set()
-        
-        for subscriber in self.subscribers:
-            try:
-                await subscriber.send(message)
-            except websockets.exceptions.ConnectionClosed:
-                disconnected.add(subscriber)
+        # Text frame, so browser clients still receive a string
+        message = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
         
-        # Remove disconnected subscribers
-        self.subscribers -= disconnected
+        # Write the same frame to every open connection without awaiting each send;
+        # closed or backed-up connections are skipped by websockets
+        websockets.broadcast(self.subscribers, message)
     
     async def register(self, websocket):
         """Register a new subscriber"""
@@ -230,17 +238,32 @@ class LiveDataStreamer:
         
     async def unregister(self, websocket):
         """Unregister a subscriber"""
-        self.subscribers.remove(websocket)
+        self.subscribers.discard(websocket)
     
-    def get_current_candlestick_data(self):
-        """Get the current candlestick data"""
-        return self.candlestick_data
+    def get_current_candlestick_data(self, num_points=None):
+        """Get the current candlestick data, optionally only the newest num_points candles"""
+        self._flush_live_candle()
+        
+        count = self._count if num_points is None else min(num_points, self._count)
+        
+        # Unwrap the ring buffer into oldest-to-newest order
+        order = np.arange(self._head - count, self._head) % _MAX_CANDLES
+        return pd.DataFrame({
+            'Time': pd.to_datetime(self._times[order], unit='s'),
+            'Open': self._open[order],
+            'High': self._high[order],
+            'Low': self._low[order],
+            'Close': self._close[order],
+            'Volume': self._volume[order]
+        })
     
     def set_timeframe(self, timeframe):
         """Set the candlestick timeframe"""
         if timeframe != self.timeframe:
             self.timeframe = timeframe
-            self.candlestick_data = self._initialize_candlestick_data()
+            # Default to 1-minute candles
+            self._bucket_seconds = _TIMEFRAME_SECONDS.get(timeframe, 60)
+            self._initialize_candlestick_data()
     
     def get_last_price(self):
         """Get the last price"""
@@ -290,7 +313,10 @@ async def start_server():
 
 def start_websocket_server():
     """Start the websocket server in a new thread"""
-    asyncio.run(start_server())
+    if uvloop is not None:
+        uvloop.run(start_server())
+    else:
+        asyncio.run(start_server())
 
 # Function to get current candlestick data (for use without websockets)
 def get_current_candlestick_data(symbol=None, timeframe="1m"):
@@ -300,10 +326,10 @@ def get_current_candlestick_data(symbol=None, timeframe="1m"):
     # Set the timeframe
     live_streamer.set_timeframe(timeframe)
     
-    # If not running or different symbol, initialize with the new symbol
-    if not live_streamer.is_running or (symbol and live_streamer.current_symbol != symbol):
-        # Run in a non-blocking way
-        asyncio.run(live_streamer.start_streaming(symbol if symbol else "RELIANCE.NS"))
+    # If not initialized or different symbol, initialize with the new symbol
+    if live_streamer.current_symbol is None or (symbol and live_streamer.current_symbol != symbol):
+        # Set up synchronously; the async streaming loop is only needed by the websocket server
+        live_streamer._setup_initial_state(symbol if symbol else "RELIANCE.NS")
     
     # Get the current data
     return live_streamer.get_current_candlestick_data()
@@ -320,30 +346,25 @@ def generate_live_data(symbol, timeframe="1m", num_points=100):
     # Set the timeframe
     live_streamer.set_timeframe(timeframe)
     
-    # Make sure we're streaming the correct symbol
-    if not live_streamer.is_running or live_streamer.current_symbol != symbol:
+    # Make sure we're simulating the correct symbol
+    if live_streamer.current_symbol != symbol:
         # Generate data synchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(live_streamer.start_streaming(symbol))
-        loop.close()
+        live_streamer._setup_initial_state(symbol)
     else:
         # Just generate a new tick to update existing data
+        now_ns = time.time_ns()
         tick_data = {
             'symbol': symbol,
-            'price': live_streamer.current_price * (1 + np.random.normal(0, 0.0005)),
-            'volume': np.random.randint(100, 1000),
-            'timestamp': datetime.now().timestamp()
+            'price': live_streamer.current_price * (1 + live_streamer._rng.normal(0, 0.0005)),
+            'volume': live_streamer._rng.integers(100, 1000),
+            'timestamp': now_ns
         }
         
         # Update the candlestick data with new tick
-        live_streamer._update_candlestick_data(tick_data)
+        live_streamer._update_candlestick_data(tick_data, now_ns / 1e9)
         
         # Update current price
         live_streamer.current_price = tick_data['price']
     
-    # Get the data
-    data = live_streamer.get_current_candlestick_data()
-    
-    # Return the requested number of points
-    return data.tail(num_points)
\ No newline at end of file
+    # Return the requested number of points straight from the ring buffer
+    return live_streamer.get_current_candlestick_data(num_points)
\ No newline at end of file
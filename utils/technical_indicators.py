@@ -4,7 +4,98 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 
-def add_moving_average(fig, data, window, column='Close', name=None, color=None, row=1, col=1):
+# Bound on decay ** -block in _ewm_mean, far below the float64 overflow at e**709
+_EWM_MAX_GROWTH = 300
+
+
+def _ewm_mean(values, alpha):
+    """
+    Calculate an exponential moving average with recursive weighting, as ewm(adjust=False).mean()
+    
+    The IIR recurrence y[t] = (1 - alpha) * y[t-1] + alpha * x[t] is evaluated in closed form
+    over blocks with cumsum, so the work stays in NumPy instead of a Python loop.
+    
+    Parameters:
+        values (np.ndarray): Values to average
+        alpha (float): Smoothing factor, e.g. 2 / (span + 1)
+        
+    Returns:
+        np.ndarray: Exponential moving average
+    """
+    x = np.asarray(values, dtype='float64')
+    
+    # Keep pandas' NaN handling for gappy input
+    if np.isnan(x).any():
+        return pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    
+    decay = 1.0 - alpha
+    if len(x) == 0 or decay <= 0:
+        return x.copy()
+    
+    block = max(1, int(_EWM_MAX_GROWTH / -np.log(decay)))
+    out = np.empty(len(x))
+    out[0] = prev = x[0]
+    
+    for start in range(1, len(x), block):
+        chunk = x[start:start + block]
+        powers = decay ** np.arange(len(chunk))
+        out[start:start + len(chunk)] = powers * (decay * prev + alpha * np.cumsum(chunk / powers))
+        prev = out[start + len(chunk) - 1]
+    
+    return out
+
+
+def _date_values(dates):
+    """
+    Convert a Date column to epoch milliseconds for plotly date axes
+    
+    Parameters:
+        dates (pd.Series): Naive datetimes
+        
+    Returns:
+        np.ndarray: Milliseconds as float64 (exact), which plotly sends as a binary array instead of ISO strings
+    """
+    return pd.to_datetime(dates).to_numpy(dtype='datetime64[ms]').view('int64').astype('float64')
+
+
+def _plot_values(values):
+    """
+    Downcast indicator values for plotting
+    
+    Parameters:
+        values (pd.Series or np.ndarray): Indicator values
+        
+    Returns:
+        np.ndarray: float32 values, which plotly serializes at half the size of float64
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+def _indicator_dates(fig, data, dates, row, col):
+    """
+    Get the x values for an indicator added to a subplot
+    
+    When dates are not passed in (a standalone call), they are computed here and
+    the subplot's x axis is set to plot the epoch milliseconds as dates;
+    create_technical_chart passes its dates and sets the axis type once itself.
+    
+    Parameters:
+        fig (plotly.graph_objects.Figure): Plotly figure the indicator is added to
+        data (pd.DataFrame): DataFrame containing the price data
+        dates (np.ndarray): Precomputed _date_values(data['Date']) or None
+        row (int): Row in subplot grid
+        col (int): Column in subplot grid
+        
+    Returns:
+        np.ndarray: Epoch-millisecond x values
+    """
+    if dates is None:
+        dates = _date_values(data['Date'])
+        fig.update_xaxes(type='date', row=row, col=col)
+    return dates
+
+
+def add_moving_average(fig, data, window, column='Close', name=None, color=None, row=1, col=1, dates=None):
     """
     Add a simple moving average to a plotly figure
     
@@ -17,19 +108,22 @@ def add_moving_average(fig, data, window, column='Close', name=None, color=None,
         color (str): Color for the MA line
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with MA
     """
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
     ma = data[column].rolling(window=window).mean()
     
     if name is None:
         name = f'{window}-day MA'
         
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=ma,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(ma),
             name=name,
             line=dict(color=color, width=1.5),
         ),
@@ -40,7 +134,7 @@ def add_moving_average(fig, data, window, column='Close', name=None, color=None,
     return fig
 
 
-def add_exponential_moving_average(fig, data, window, column='Close', name=None, color=None, row=1, col=1):
+def add_exponential_moving_average(fig, data, window, column='Close', name=None, color=None, row=1, col=1, dates=None):
     """
     Add an exponential moving average to a plotly figure
     
@@ -53,19 +147,22 @@ def add_exponential_moving_average(fig, data, window, column='Close', name=None,
         color (str): Color for the EMA line
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with EMA
     """
-    ema = data[column].ewm(span=window, adjust=False).mean()
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
+    ema = _ewm_mean(data[column].to_numpy(dtype='float64'), 2 / (window + 1))
     
     if name is None:
         name = f'{window}-day EMA'
         
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=ema,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(ema),
             name=name,
             line=dict(color=color, width=1.5),
         ),
@@ -76,7 +173,46 @@ def add_exponential_moving_average(fig, data, window, column='Close', name=None,
     return fig
 
 
-def add_bollinger_bands(fig, data, window=20, num_std=2, column='Close', row=1, col=1):
+def _rolling_mean_std(series, window):
+    """
+    Calculate the rolling mean and sample standard deviation in one pass using prefix sums
+    
+    Parameters:
+        series (pd.Series): Values to aggregate
+        window (int): Window size
+        
+    Returns:
+        tuple: Rolling mean, rolling standard deviation (NaN until a full window of valid values)
+    """
+    x = series.to_numpy(dtype='float64')
+    valid = ~np.isnan(x)
+    
+    # Shift by the first valid value so the squared sums stay well conditioned
+    shift = x[valid][0] if valid.any() else 0.0
+    centered = np.where(valid, x - shift, 0.0)
+    
+    c1 = np.concatenate(([0.0], np.cumsum(centered)))
+    c2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    cn = np.concatenate(([0], np.cumsum(valid)))
+    
+    mean = np.full(len(x), np.nan)
+    std = np.full(len(x), np.nan)
+    
+    if len(x) >= window:
+        s = c1[window:] - c1[:-window]
+        ss = c2[window:] - c2[:-window]
+        full = (cn[window:] - cn[:-window]) == window
+        
+        window_mean = s / window
+        window_var = np.maximum(ss - s * window_mean, 0.0) / (window - 1)
+        
+        mean[window - 1:] = np.where(full, window_mean + shift, np.nan)
+        std[window - 1:] = np.where(full, np.sqrt(window_var), np.nan)
+    
+    return pd.Series(mean, index=series.index), pd.Series(std, index=series.index)
+
+
+def add_bollinger_bands(fig, data, window=20, num_std=2, column='Close', row=1, col=1, dates=None):
     """
     Add Bollinger Bands to a plotly figure
     
@@ -88,21 +224,23 @@ def add_bollinger_bands(fig, data, window=20, num_std=2, column='Close', row=1,
         column (str): Column name to calculate bands on (default: 'Close')
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with Bollinger Bands
     """
-    ma = data[column].rolling(window=window).mean()
-    std = data[column].rolling(window=window).std()
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
+    ma, std = _rolling_mean_std(data[column], window)
     
-    upper_band = ma + (std * num_std)
-    lower_band = ma - (std * num_std)
+    upper_band = _plot_values(ma + (std * num_std))
+    lower_band = _plot_values(ma - (std * num_std))
     
     # Add the moving average
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=ma,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(ma),
             name=f'{window}-day MA',
             line=dict(color='rgba(30, 136, 229, 0.8)', width=1),
         ),
@@ -112,36 +250,8 @@ def add_bollinger_bands(fig, data, window=20, num_std=2, column='Close', row=1,
     
     # Add the upper band
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=upper_band,
-            name='Upper Band',
-            line=dict(color='rgba(0, 0, 0, 0)'),
-            showlegend=False,
-        ),
-        row=row,
-        col=col
-    )
-    
-    # Add the lower band
-    fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=lower_band,
-            name='Lower Band',
-            line=dict(color='rgba(0, 0, 0, 0)'),
-            fill='tonexty',
-            fillcolor='rgba(30, 136, 229, 0.1)',
-            showlegend=False,
-        ),
-        row=row,
-        col=col
-    )
-    
-    # Add the upper band (visible line)
-    fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
+        go.Scattergl(
+            x=dates,
             y=upper_band,
             name='Upper Band',
             line=dict(color='rgba(30, 136, 229, 0.5)', width=1, dash='dash'),
@@ -150,13 +260,15 @@ def add_bollinger_bands(fig, data, window=20, num_std=2, column='Close', row=1,
         col=col
     )
     
-    # Add the lower band (visible line)
+    # Add the lower band, shading the area up to the upper band
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
+        go.Scattergl(
+            x=dates,
             y=lower_band,
             name='Lower Band',
             line=dict(color='rgba(30, 136, 229, 0.5)', width=1, dash='dash'),
+            fill='tonexty',
+            fillcolor='rgba(30, 136, 229, 0.1)',
         ),
         row=row,
         col=col
@@ -177,21 +289,28 @@ def calculate_rsi(data, window=14, column='Close'):
     Returns:
         pd.Series: RSI values
     """
-    delta = data[column].diff()
+    x = data[column].to_numpy(dtype='float64')
+    delta = np.diff(x, prepend=np.nan)
     
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    gain = np.maximum(delta, 0)
+    loss = np.maximum(-delta, 0)
     
-    avg_gain = gain.rolling(window=window).mean()
-    avg_loss = loss.rolling(window=window).mean()
+    # Wilder's smoothing: seed with the simple average of the first window, then alpha = 1 / window
+    avg_gain = np.full(len(x), np.nan)
+    avg_loss = np.full(len(x), np.nan)
     
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+    if len(x) > window:
+        avg_gain[window:] = _ewm_mean(np.concatenate(([gain[1:window + 1].mean()], gain[window + 1:])), 1 / window)
+        avg_loss[window:] = _ewm_mean(np.concatenate(([loss[1:window + 1].mean()], loss[window + 1:])), 1 / window)
     
-    return rsi
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
+    
+    return pd.Series(rsi, index=data.index)
 
 
-def add_rsi(fig, data, window=14, column='Close', row=2, col=1):
+def add_rsi(fig, data, window=14, column='Close', row=2, col=1, dates=None):
     """
     Add Relative Strength Index (RSI) to a plotly figure
     
@@ -202,16 +321,19 @@ def add_rsi(fig, data, window=14, column='Close', row=2, col=1):
         column (str): Column name to calculate RSI on (default: 'Close')
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with RSI
     """
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
     rsi = calculate_rsi(data, window, column)
     
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=rsi,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(rsi),
             name=f'RSI ({window})',
             line=dict(color='#E53935', width=1.5),
         ),
@@ -220,40 +342,28 @@ def add_rsi(fig, data, window=14, column='Close', row=2, col=1):
     )
     
     # Add overbought line
-    fig.add_trace(
-        go.Scatter(
-            x=[data['Date'].iloc[0], data['Date'].iloc[-1]],
-            y=[70, 70],
-            name='Overbought',
-            line=dict(color='rgba(229, 57, 53, 0.3)', width=1, dash='dash'),
-            showlegend=False,
-        ),
+    fig.add_hline(
+        y=70,
+        name='Overbought',
+        line=dict(color='rgba(229, 57, 53, 0.3)', width=1, dash='dash'),
         row=row,
         col=col
     )
     
     # Add oversold line
-    fig.add_trace(
-        go.Scatter(
-            x=[data['Date'].iloc[0], data['Date'].iloc[-1]],
-            y=[30, 30],
-            name='Oversold',
-            line=dict(color='rgba(67, 160, 71, 0.3)', width=1, dash='dash'),
-            showlegend=False,
-        ),
+    fig.add_hline(
+        y=30,
+        name='Oversold',
+        line=dict(color='rgba(67, 160, 71, 0.3)', width=1, dash='dash'),
         row=row,
         col=col
     )
     
     # Add middle line
-    fig.add_trace(
-        go.Scatter(
-            x=[data['Date'].iloc[0], data['Date'].iloc[-1]],
-            y=[50, 50],
-            name='Middle',
-            line=dict(color='rgba(0, 0, 0, 0.2)', width=1, dash='dash'),
-            showlegend=False,
-        ),
+    fig.add_hline(
+        y=50,
+        name='Middle',
+        line=dict(color='rgba(0, 0, 0, 0.2)', width=1, dash='dash'),
         row=row,
         col=col
     )
@@ -283,18 +393,24 @@ def calculate_macd(data, fast_period=12, slow_period=26, signal_period=9, column
     Returns:
         tuple: MACD line, Signal line, Histogram
     """
-    fast_ema = data[column].ewm(span=fast_period, adjust=False).mean()
-    slow_ema = data[column].ewm(span=slow_period, adjust=False).mean()
+    x = data[column].to_numpy(dtype='float64')
+    
+    fast_ema = _ewm_mean(x, 2 / (fast_period + 1))
+    slow_ema = _ewm_mean(x, 2 / (slow_period + 1))
     
     macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+    signal_line = _ewm_mean(macd_line, 2 / (signal_period + 1))
     
     histogram = macd_line - signal_line
     
-    return macd_line, signal_line, histogram
+    return (
+        pd.Series(macd_line, index=data.index),
+        pd.Series(signal_line, index=data.index),
+        pd.Series(histogram, index=data.index)
+    )
 
 
-def add_macd(fig, data, fast_period=12, slow_period=26, signal_period=9, column='Close', row=3, col=1):
+def add_macd(fig, data, fast_period=12, slow_period=26, signal_period=9, column='Close', row=3, col=1, dates=None):
     """
     Add Moving Average Convergence Divergence (MACD) to a plotly figure
     
@@ -307,17 +423,20 @@ def add_macd(fig, data, fast_period=12, slow_period=26, signal_period=9, column=
         column (str): Column name to calculate MACD on (default: 'Close')
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with MACD
     """
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
     macd_line, signal_line, histogram = calculate_macd(data, fast_period, slow_period, signal_period, column)
     
     # Add MACD line
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=macd_line,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(macd_line),
             name='MACD',
             line=dict(color='#1E88E5', width=1.5),
         ),
@@ -327,9 +446,9 @@ def add_macd(fig, data, fast_period=12, slow_period=26, signal_period=9, column=
     
     # Add Signal line
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=signal_line,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(signal_line),
             name='Signal',
             line=dict(color='#FF9800', width=1.5),
         ),
@@ -338,12 +457,13 @@ def add_macd(fig, data, fast_period=12, slow_period=26, signal_period=9, column=
     )
     
     # Add Histogram
-    colors = ['#43A047' if val >= 0 else '#E53935' for val in histogram]
+    # tolist(): NumPy string arrays make plotly fall back from orjson to the slower json encoder
+    colors = np.where(histogram.to_numpy() >= 0, '#43A047', '#E53935').tolist()
     
     fig.add_trace(
         go.Bar(
-            x=data['Date'],
-            y=histogram,
+            x=dates,
+            y=_plot_values(histogram),
             name='Histogram',
             marker_color=colors,
             opacity=0.5,
@@ -390,7 +510,7 @@ def calculate_stochastic(data, k_period=14, d_period=3, smooth_k=3):
     return k, d
 
 
-def add_stochastic(fig, data, k_period=14, d_period=3, smooth_k=3, row=4, col=1):
+def add_stochastic(fig, data, k_period=14, d_period=3, smooth_k=3, row=4, col=1, dates=None):
     """
     Add Stochastic Oscillator to a plotly figure
     
@@ -402,17 +522,20 @@ def add_stochastic(fig, data, k_period=14, d_period=3, smooth_k=3, row=4, col=1)
         smooth_k (int): Smoothing for K (default: 3)
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with Stochastic
     """
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
     k, d = calculate_stochastic(data, k_period, d_period, smooth_k)
     
     # Add %K line
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=k,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(k),
             name='%K',
             line=dict(color='#1E88E5', width=1.5),
         ),
@@ -422,9 +545,9 @@ def add_stochastic(fig, data, k_period=14, d_period=3, smooth_k=3, row=4, col=1)
     
     # Add %D line
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=d,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(d),
             name='%D',
             line=dict(color='#FF9800', width=1.5),
         ),
@@ -433,27 +556,19 @@ def add_stochastic(fig, data, k_period=14, d_period=3, smooth_k=3, row=4, col=1)
     )
     
     # Add overbought line
-    fig.add_trace(
-        go.Scatter(
-            x=[data['Date'].iloc[0], data['Date'].iloc[-1]],
-            y=[80, 80],
-            name='Overbought',
-            line=dict(color='rgba(229, 57, 53, 0.3)', width=1, dash='dash'),
-            showlegend=False,
-        ),
+    fig.add_hline(
+        y=80,
+        name='Overbought',
+        line=dict(color='rgba(229, 57, 53, 0.3)', width=1, dash='dash'),
         row=row,
         col=col
     )
     
     # Add oversold line
-    fig.add_trace(
-        go.Scatter(
-            x=[data['Date'].iloc[0], data['Date'].iloc[-1]],
-            y=[20, 20],
-            name='Oversold',
-            line=dict(color='rgba(67, 160, 71, 0.3)', width=1, dash='dash'),
-            showlegend=False,
-        ),
+    fig.add_hline(
+        y=20,
+        name='Oversold',
+        line=dict(color='rgba(67, 160, 71, 0.3)', width=1, dash='dash'),
         row=row,
         col=col
     )
@@ -480,19 +595,21 @@ def calculate_atr(data, window=14):
     Returns:
         pd.Series: ATR values
     """
-    high_low = data['High'] - data['Low']
-    high_close = (data['High'] - data['Close'].shift()).abs()
-    low_close = (data['Low'] - data['Close'].shift()).abs()
+    high = data['High'].to_numpy(dtype='float64')
+    low = data['Low'].to_numpy(dtype='float64')
+    prev_close = np.empty_like(high)
+    prev_close[:1] = np.nan
+    prev_close[1:] = data['Close'].to_numpy(dtype='float64')[:-1]
     
-    ranges = pd.concat([high_low, high_close, low_close], axis=1)
-    true_range = ranges.max(axis=1)
+    # fmax skips the missing previous close on the first row, like DataFrame.max(axis=1)
+    true_range = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
     
-    atr = true_range.rolling(window=window).mean()
+    atr = pd.Series(true_range, index=data.index).rolling(window=window).mean()
     
     return atr
 
 
-def add_atr(fig, data, window=14, row=5, col=1):
+def add_atr(fig, data, window=14, row=5, col=1, dates=None):
     """
     Add Average True Range (ATR) to a plotly figure
     
@@ -502,16 +619,19 @@ def add_atr(fig, data, window=14, row=5, col=1):
         window (int): Window size for ATR calculation (default: 14)
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with ATR
     """
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
     atr = calculate_atr(data, window)
     
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=atr,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(atr),
             name=f'ATR ({window})',
             line=dict(color='#9C27B0', width=1.5),
         ),
@@ -539,21 +659,25 @@ def calculate_on_balance_volume(data):
     Returns:
         pd.Series: OBV values
     """
-    obv = pd.Series(index=data.index, dtype='float64')
-    obv.iloc[0] = 0
+    close = data['Close'].to_numpy(dtype='float64')
+    volume = data['Volume'].to_numpy(dtype='float64')
+    
+    if len(close) == 0:
+        return pd.Series(index=data.index, dtype='float64')
+    
+    # +1 on up days, -1 on down days, 0 when unchanged (or NaN)
+    signed_volume = np.nan_to_num(np.sign(np.diff(close)), copy=False)
+    signed_volume *= volume[1:]
     
-    for i in range(1, len(data)):
-        if data['Close'].iloc[i] > data['Close'].iloc[i-1]:
-            obv.iloc[i] = obv.iloc[i-1] + data['Volume'].iloc[i]
-        elif data['Close'].iloc[i] < data['Close'].iloc[i-1]:
-            obv.iloc[i] = obv.iloc[i-1] - data['Volume'].iloc[i]
-        else:
-            obv.iloc[i] = obv.iloc[i-1]
+    # Accumulate straight into the output buffer
+    obv = np.empty(len(close))
+    obv[0] = 0.0
+    np.cumsum(signed_volume, out=obv[1:])
     
-    return obv
+    return pd.Series(obv, index=data.index)
 
 
-def add_obv(fig, data, row=6, col=1):
+def add_obv(fig, data, row=6, col=1, dates=None):
     """
     Add On Balance Volume (OBV) to a plotly figure
     
@@ -562,16 +686,19 @@ def add_obv(fig, data, row=6, col=1):
         data (pd.DataFrame): DataFrame containing the price and volume data
         row (int): Row in subplot grid
         col (int): Column in subplot grid
+        dates (np.ndarray): Precomputed _date_values(data['Date']) (default: computed here)
         
     Returns:
         plotly.graph_objects.Figure: Updated figure with OBV
     """
+    dates = _indicator_dates(fig, data, dates, row, col)
+    
     obv = calculate_on_balance_volume(data)
     
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=obv,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(obv),
             name='OBV',
             line=dict(color='#795548', width=1.5),
         ),
@@ -580,12 +707,12 @@ def add_obv(fig, data, row=6, col=1):
     )
     
     # Add 20-day EMA of OBV
-    obv_ema = obv.ewm(span=20, adjust=False).mean()
+    obv_ema = _ewm_mean(obv.to_numpy(), 2 / (20 + 1))
     
     fig.add_trace(
-        go.Scatter(
-            x=data['Date'],
-            y=obv_ema,
+        go.Scattergl(
+            x=dates,
+            y=_plot_values(obv_ema),
             name='OBV EMA (20)',
             line=dict(color='#FFB300', width=1.5, dash='dash'),
         ),
@@ -614,6 +741,8 @@ def create_technical_chart(data, indicators=None):
     Returns:
         plotly.graph_objects.Figure: Technical analysis chart
     """
+    dates = _date_values(data['Date'])
+    
     if indicators is None:
         indicators = ['sma', 'ema', 'bollinger']
     
@@ -652,11 +781,11 @@ def create_technical_chart(data, indicators=None):
     # Add main price candlestick chart
     fig.add_trace(
         go.Candlestick(
-            x=data['Date'],
-            open=data['Open'],
-            high=data['High'],
-            low=data['Low'],
-            close=data['Close'],
+            x=dates,
+            open=data['Open'].to_numpy(),
+            high=data['High'].to_numpy(),
+            low=data['Low'].to_numpy(),
+            close=data['Close'].to_numpy(),
             name='Price',
             increasing_line_color='#26A69A',  # green
             decreasing_line_color='#EF5350',  # red
@@ -666,13 +795,13 @@ def create_technical_chart(data, indicators=None):
     )
     
     # Add volume bars
-    colors = ['#26A69A' if data['Close'].iloc[i] >= data['Open'].iloc[i] else '#EF5350' 
-              for i in range(len(data))]
+    # tolist(): NumPy string arrays make plotly fall back from orjson to the slower json encoder
+    colors = np.where(data['Close'].to_numpy() >= data['Open'].to_numpy(), '#26A69A', '#EF5350').tolist()
     
     fig.add_trace(
         go.Bar(
-            x=data['Date'],
-            y=data['Volume'],
+            x=dates,
+            y=data['Volume'].to_numpy(),
             name='Volume',
             marker_color=colors,
             opacity=0.3,
@@ -688,21 +817,21 @@ def create_technical_chart(data, indicators=None):
     
     # Simple Moving Averages
     if 'sma' in indicators:
-        fig = add_moving_average(fig, data, window=50, color='#1E88E5', row=1, col=1)
-        fig = add_moving_average(fig, data, window=200, color='#E53935', row=1, col=1)
+        fig = add_moving_average(fig, data, window=50, color='#1E88E5', row=1, col=1, dates=dates)
+        fig = add_moving_average(fig, data, window=200, color='#E53935', row=1, col=1, dates=dates)
     
     # Exponential Moving Averages
     if 'ema' in indicators:
-        fig = add_exponential_moving_average(fig, data, window=20, color='#FFB300', row=1, col=1)
+        fig = add_exponential_moving_average(fig, data, window=20, color='#FFB300', row=1, col=1, dates=dates)
     
     # Bollinger Bands
     if 'bollinger' in indicators:
-        fig = add_bollinger_bands(fig, data, window=20, num_std=2, row=1, col=1)
+        fig = add_bollinger_bands(fig, data, window=20, num_std=2, row=1, col=1, dates=dates)
     
     # RSI
     if 'rsi' in indicators:
         current_row += 1
-        fig = add_rsi(fig, data, window=14, row=current_row, col=1)
+        fig = add_rsi(fig, data, window=14, row=current_row, col=1, dates=dates)
         fig.update_layout(
             annotations=[
                 dict(
@@ -722,7 +851,7 @@ def create_technical_chart(data, indicators=None):
     # MACD
     if 'macd' in indicators:
         current_row += 1
-        fig = add_macd(fig, data, row=current_row, col=1)
+        fig = add_macd(fig, data, row=current_row, col=1, dates=dates)
         fig.update_layout(
             annotations=[
                 dict(
@@ -742,7 +871,7 @@ def create_technical_chart(data, indicators=None):
     # Stochastic Oscillator
     if 'stoch' in indicators:
         current_row += 1
-        fig = add_stochastic(fig, data, row=current_row, col=1)
+        fig = add_stochastic(fig, data, row=current_row, col=1, dates=dates)
         fig.update_layout(
             annotations=[
                 dict(
@@ -762,7 +891,7 @@ def create_technical_chart(data, indicators=None):
     # ATR
     if 'atr' in indicators:
         current_row += 1
-        fig = add_atr(fig, data, row=current_row, col=1)
+        fig = add_atr(fig, data, row=current_row, col=1, dates=dates)
         fig.update_layout(
             annotations=[
                 dict(
@@ -782,7 +911,7 @@ def create_technical_chart(data, indicators=None):
     # OBV
     if 'obv' in indicators:
         current_row += 1
-        fig = add_obv(fig, data, row=current_row, col=1)
+        fig = add_obv(fig, data, row=current_row, col=1, dates=dates)
         fig.update_layout(
             annotations=[
                 dict(
@@ -828,6 +957,9 @@ def create_technical_chart(data, indicators=None):
         col=1
     )
     
+    # Plot the epoch-millisecond x values as dates on every subplot
+    fig.update_xaxes(type='date')
+    
     # Update x-axis
     fig.update_xaxes(
         title_text="Date",